@@ -217,7 +217,8 @@ class A2AGateway:
 
         if tool_name:
             session_id = mcp_server.create_session()
-            result = mcp_server.invoke_tool(session_id, tool_name, task.payload)
+            # A2A tasks already run off the request path and need the result
+            result = mcp_server.invoke_tool(session_id, tool_name, task.payload, sync=True)
             return result.get("result", result)
 
         return {"error": f"No handler for {task.to_agent}/{task.action}"}
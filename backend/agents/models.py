@@ -1,7 +1,9 @@
 """Agent execution tracking models."""
-import uuid
 from django.db import models
 
+from core.ids import uuid7
+from core.serialization import OrjsonDecoder, OrjsonEncoder
+
 
 class AgentExecution(models.Model):
     """Records every individual agent invocation within a workflow run."""
@@ -14,7 +16,7 @@ class AgentExecution(models.Model):
         ('coordinator', 'Coordinator'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     run = models.ForeignKey(
         'patients.WorkflowRun',
         on_delete=models.CASCADE,
@@ -26,7 +28,7 @@ class AgentExecution(models.Model):
         blank=True,
         help_text='Patient identifier in P00000 format',
     )
-    payload = models.JSONField(default=dict)
+    payload = models.JSONField(default=dict, encoder=OrjsonEncoder, decoder=OrjsonDecoder)
     duration_ms = models.FloatField(default=0.0)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
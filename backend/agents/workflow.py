@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 
 from .base import AgentOutput
@@ -61,6 +62,9 @@ _MODEL_FIELD_MAP = {
     'paths_like_function': 'paths_like_function_score',
 }
 
+# RiskAssessment rows buffered per INSERT while a workflow runs
+ASSESSMENT_BATCH = 500
+
 # Map coordinator autonomy_level int to RiskAssessment CharField values
 _AUTONOMY_INT_TO_STR = {
     0: 'RECOMMEND_ONLY',
@@ -191,7 +195,10 @@ def run_screening_workflow(
     str
         The UUID (as string) of the created WorkflowRun.
     """
-    from patients.models import Patient, WorkflowRun, RiskAssessment, PolicyConfiguration
+    from patients.models import (
+        Patient, PatientCardSnapshot, PolicyConfiguration, RiskAssessment,
+        RiskAssessmentDetail, WorkflowRun,
+    )
     from .models import AgentExecution
 
     workflow_start = time.time()
@@ -264,6 +271,16 @@ def run_screening_workflow(
         patient_cards: List[Dict[str, Any]] = []
         candidates_df = patients_df[patients_df['patient_id'].isin(candidate_ids)]
 
+        # Resolve all candidate primary keys in one query and insert the
+        # assessments in batches instead of a lookup + INSERT per patient.
+        patient_pks = dict(
+            Patient.objects.filter(patient_id__in=candidate_ids).values_list('patient_id', 'id')
+        )
+        pending_assessments: List[RiskAssessment] = []
+        pending_details: List[RiskAssessmentDetail] = []
+        # Card digest -> payload for the snapshots the pending rows point at
+        pending_cards: Dict[str, Dict[str, Any]] = {}
+
         auto_count = 0
         draft_count = 0
         recommend_count = 0
@@ -333,26 +350,35 @@ def run_screening_workflow(
             total_flags += flag_count
 
             # -- Persist RiskAssessment --
-            try:
-                patient_obj = Patient.objects.get(patient_id=pid)
-                autonomy_int = coord_out.payload.get('autonomy_level', 0)
-                autonomy_str = _AUTONOMY_INT_TO_STR.get(autonomy_int, 'RECOMMEND_ONLY')
-
-                RiskAssessment.objects.create(
-                    patient=patient_obj,
-                    run_id=wf_run.id,
-                    risk_score=risk_score,
-                    action=action,
-                    autonomy_level=autonomy_str,
-                    feature_contributions=pheno_out.payload.get('feature_contributions', {}),
-                    flags=safety_out.payload.get('flags', []),
-                    flag_count=flag_count,
-                    rationale=coord_out.payload,
-                    notes_analysis=notes_out.payload,
-                    patient_card=card,
-                )
-            except Exception as e:
-                logger.error(f"Failed to create RiskAssessment for {pid}: {e}")
+            patient_pk = patient_pks.get(pid)
+            if patient_pk is None:
+                logger.error(f"Failed to create RiskAssessment for {pid}: patient not found")
+                continue
+            autonomy_int = coord_out.payload.get('autonomy_level', 0)
+            autonomy_str = _AUTONOMY_INT_TO_STR.get(autonomy_int, 'RECOMMEND_ONLY')
+            card_digest = PatientCardSnapshot.digest(card)
+            pending_cards[card_digest] = card
+
+            assessment = RiskAssessment(
+                patient_id=patient_pk,
+                run_id=wf_run.id,
+                risk_score=risk_score,
+                action=action,
+                autonomy_level=autonomy_str,
+                flags=safety_out.payload.get('flags', []),
+                patient_card_id=card_digest,
+            )
+            pending_assessments.append(assessment)
+            pending_details.append(RiskAssessmentDetail(
+                assessment=assessment,
+                feature_contributions=pheno_out.payload.get('feature_contributions', {}),
+                rationale=coord_out.payload,
+                notes_analysis=notes_out.payload,
+            ))
+            if len(pending_assessments) >= ASSESSMENT_BATCH:
+                _flush_assessments(pending_assessments, pending_details, pending_cards)
+
+        _flush_assessments(pending_assessments, pending_details, pending_cards)
 
         # ---- Step 6: Compute metrics ----
         metrics = _compute_metrics(patient_cards, policy)
@@ -404,6 +430,32 @@ def run_screening_workflow(
         raise
 
 
+def _flush_assessments(
+    pending: List[Any], details: List[Any], cards: Dict[str, Dict[str, Any]],
+) -> None:
+    """
+    Bulk-insert buffered RiskAssessment rows, after the card snapshots they
+    reference and before their detail rows, and empty the buffers. Snapshots
+    already stored by an earlier run are skipped by the primary-key conflict.
+    A failed batch raises, so the caller marks the run FAILED rather than
+    completing it with assessments missing.
+    """
+    from patients.models import PatientCardSnapshot, RiskAssessment, RiskAssessmentDetail
+
+    if not pending:
+        return
+    with transaction.atomic():
+        PatientCardSnapshot.objects.bulk_create(
+            [PatientCardSnapshot(sha256=h, payload=c) for h, c in cards.items()],
+            ignore_conflicts=True,
+        )
+        RiskAssessment.objects.bulk_create(pending)
+        RiskAssessmentDetail.objects.bulk_create(details)
+    pending.clear()
+    details.clear()
+    cards.clear()
+
+
 def _create_workflow_notifications(
     wf_run,
     patient_cards: List[Dict[str, Any]],
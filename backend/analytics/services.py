@@ -2,38 +2,50 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple
-from django.db.models import Avg
+from django.db.models import Avg, Count, Q
 from patients.models import Patient, RiskAssessment, WorkflowRun, PolicyConfiguration
 
 
+# Conditions shared by the confusion-matrix aggregates
+_FLAGGED = ~Q(action='NO_ACTION')
+_AT_RISK = Q(patient__true_at_risk=True)
+
+_CONFUSION_AGGREGATES = {
+    'tp': Count('pk', filter=_FLAGGED & _AT_RISK),
+    'fp': Count('pk', filter=_FLAGGED & ~_AT_RISK),
+    'tn': Count('pk', filter=~_FLAGGED & ~_AT_RISK),
+    'fn': Count('pk', filter=~_FLAGGED & _AT_RISK),
+}
+
+
 def confusion_counts(assessments_qs) -> Tuple[int, int, int, int]:
     """Compute TP, FP, TN, FN from assessments queryset."""
-    tp = fp = tn = fn = 0
-    for a in assessments_qs.select_related('patient'):
-        predicted_positive = a.action != 'NO_ACTION'
-        actual_positive = a.patient.true_at_risk
-        if actual_positive and predicted_positive:
-            tp += 1
-        elif not actual_positive and predicted_positive:
-            fp += 1
-        elif not actual_positive and not predicted_positive:
-            tn += 1
-        else:
-            fn += 1
-    return tp, fp, tn, fn
+    c = assessments_qs.aggregate(**_CONFUSION_AGGREGATES)
+    return c['tp'], c['fp'], c['tn'], c['fn']
 
 
 def compute_workflow_metrics(run_id) -> Dict[str, Any]:
     """Compute comprehensive metrics for a workflow run."""
     run = WorkflowRun.objects.get(id=run_id)
-    assessments = RiskAssessment.objects.filter(run_id=run_id)
+    # Every count in one aggregate query instead of a count per metric plus
+    # a pass over the rows for the confusion matrix
+    c = RiskAssessment.objects.filter(run_id=run_id).aggregate(
+        total=Count('pk'),
+        flagged=Count('pk', filter=_FLAGGED),
+        auto=Count('pk', filter=Q(action='AUTO_ORDER_MRI_AND_NOTIFY_NEURO')),
+        draft=Count('pk', filter=Q(action='DRAFT_MRI_ORDER')),
+        recommend=Count('pk', filter=Q(action='RECOMMEND_NEURO_REVIEW')),
+        no_action=Count('pk', filter=Q(action='NO_ACTION')),
+        with_flags=Count('pk', filter=Q(flag_count__gt=0)),
+        avg_risk=Avg('risk_score'),
+        **_CONFUSION_AGGREGATES,
+    )
     
-    total = assessments.count()
+    total = c['total']
     if total == 0:
         return {'error': 'No assessments found'}
     
-    flagged = assessments.exclude(action='NO_ACTION')
-    tp, fp, tn, fn = confusion_counts(assessments)
+    tp, fp, tn, fn = c['tp'], c['fp'], c['tn'], c['fn']
     
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -42,27 +54,23 @@ def compute_workflow_metrics(run_id) -> Dict[str, Any]:
     return {
         'run_id': str(run_id),
         'total_assessed': total,
-        'flagged_count': flagged.count(),
+        'flagged_count': c['flagged'],
         'precision': round(precision, 4),
         'recall': round(recall, 4),
         'f1_score': round(f1, 4),
         'tp': tp, 'fp': fp, 'tn': tn, 'fn': fn,
-        'auto_actions': assessments.filter(action='AUTO_ORDER_MRI_AND_NOTIFY_NEURO').count(),
-        'draft_actions': assessments.filter(action='DRAFT_MRI_ORDER').count(),
-        'recommend_actions': assessments.filter(action='RECOMMEND_NEURO_REVIEW').count(),
-        'no_actions': assessments.filter(action='NO_ACTION').count(),
-        'safety_flag_rate': round(
-            assessments.filter(flag_count__gt=0).count() / total, 4
-        ) if total > 0 else 0.0,
-        'avg_risk_score': round(
-            assessments.aggregate(avg=Avg('risk_score'))['avg'] or 0, 4
-        ),
+        'auto_actions': c['auto'],
+        'draft_actions': c['draft'],
+        'recommend_actions': c['recommend'],
+        'no_actions': c['no_action'],
+        'safety_flag_rate': round(c['with_flags'] / total, 4),
+        'avg_risk_score': round(c['avg_risk'] or 0, 4),
     }
 
 
 def subgroup_analysis(run_id, group_by: str) -> List[Dict[str, Any]]:
     """Compute fairness metrics stratified by a demographic/clinical group."""
-    assessments = RiskAssessment.objects.filter(run_id=run_id).select_related('patient')
+    assessments = RiskAssessment.list_qs().filter(run_id=run_id)
     
     if not assessments.exists():
         return []
@@ -164,7 +172,7 @@ def autonomy_distribution(run_id) -> List[Dict[str, Any]]:
 
 def calibration_data(run_id, n_bins=10) -> List[Dict[str, Any]]:
     """Compute calibration data (predicted risk vs actual at-risk rate)."""
-    assessments = RiskAssessment.objects.filter(run_id=run_id).select_related('patient')
+    assessments = RiskAssessment.list_qs().filter(run_id=run_id)
     
     pairs = [(a.risk_score, int(a.patient.true_at_risk)) for a in assessments]
     if not pairs:
@@ -186,7 +194,7 @@ def calibration_data(run_id, n_bins=10) -> List[Dict[str, Any]]:
 
 def what_if_analysis(run_id, policy_overrides: Dict[str, Any]) -> Dict[str, Any]:
     """Re-evaluate existing assessments with different policy thresholds."""
-    assessments = RiskAssessment.objects.filter(run_id=run_id).select_related('patient')
+    assessments = RiskAssessment.list_qs().filter(run_id=run_id)
     
     base_policy = {
         'risk_review_threshold': 0.65,
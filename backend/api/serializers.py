@@ -77,12 +77,28 @@ class PatientDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
     
     def get_risk_assessments(self, obj):
-        assessments = obj.risk_assessments.order_by('-created_at')[:10]
+        assessments = getattr(obj, 'recent_assessments', None)
+        if assessments is None:
+            assessments = obj.risk_assessments.select_related(
+                'patient_card', 'detail'
+            ).order_by('-created_at')[:10]
         return RiskAssessmentSerializer(assessments, many=True).data
 
 
 class RiskAssessmentSerializer(serializers.ModelSerializer):
+    """
+    Read-only view of an assessment. Rows are written only by the screening
+    workflow, which stores the card as a content-addressed snapshot; reviews
+    go through ReviewSerializer / BulkReviewSerializer.
+    """
     patient_display = serializers.CharField(source='patient.patient_id', read_only=True)
+    patient_card = serializers.JSONField(source='patient_card.payload', read_only=True)
+    feature_contributions = serializers.JSONField(
+        source='detail.feature_contributions', read_only=True
+    )
+    rationale = serializers.JSONField(source='detail.rationale', read_only=True)
+    notes_analysis = serializers.JSONField(source='detail.notes_analysis', read_only=True)
+    llm_summary = serializers.CharField(source='detail.llm_summary', read_only=True)
     
     class Meta:
         model = RiskAssessment
@@ -93,12 +109,17 @@ class RiskAssessmentSerializer(serializers.ModelSerializer):
             'patient_card', 'reviewed_by', 'review_notes', 'reviewed_at',
             'created_at',
         ]
+        read_only_fields = fields
 
 
 class PolicyConfigurationSerializer(serializers.ModelSerializer):
     class Meta:
         model = PolicyConfiguration
         fields = '__all__'
+        # Saving an active policy deactivates the current one (see
+        # PolicyConfiguration.save), so the one-active constraint is not a
+        # validation error here.
+        extra_kwargs = {'is_active': {'validators': []}}
 
 
 class WorkflowRunSerializer(serializers.ModelSerializer):
@@ -159,3 +180,11 @@ class ReviewSerializer(serializers.Serializer):
         choices=['NO_ACTION', 'RECOMMEND_NEURO_REVIEW', 'DRAFT_MRI_ORDER', 'AUTO_ORDER_MRI_AND_NOTIFY_NEURO'],
         required=False
     )
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    assessment_ids = serializers.ListField(
+        child=serializers.UUIDField(), min_length=1, max_length=1000
+    )
+    reviewed_by = serializers.CharField(max_length=200)
+    review_notes = serializers.CharField(allow_blank=True, required=False, default='')
@@ -1,8 +1,9 @@
 """REST API views for the MS Risk Lab application."""
 import logging
 from django.contrib.auth import authenticate
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, F, Q
 from rest_framework import viewsets, status, filters
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import api_view, action, permission_classes
@@ -11,7 +12,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 
-from patients.models import Patient, RiskAssessment, PolicyConfiguration, WorkflowRun
+from patients.models import (
+    ACTIVE_POLICY_CACHE_KEY, Patient, RiskAssessment, PolicyConfiguration, WorkflowRun,
+)
 from governance.models import GovernanceRule, ComplianceReport
 from core.models import AuditLog, Notification
 from .serializers import (
@@ -19,7 +22,7 @@ from .serializers import (
     PolicyConfigurationSerializer, WorkflowRunSerializer,
     GovernanceRuleSerializer, ComplianceReportSerializer,
     AuditLogSerializer, NotificationSerializer,
-    WorkflowTriggerSerializer, WhatIfSerializer, ReviewSerializer,
+    WorkflowTriggerSerializer, WhatIfSerializer, ReviewSerializer, BulkReviewSerializer,
     LoginSerializer, RegisterSerializer, UserSerializer, ChangePasswordSerializer,
 )
 from analytics.services import (
@@ -27,9 +30,25 @@ from analytics.services import (
     action_distribution, autonomy_distribution, calibration_data,
     what_if_analysis,
 )
+from analytics.tasks import generate_compliance_report
+from agents.tasks import run_screening_workflow_task
 
 logger = logging.getLogger(__name__)
 
+ACTIVE_POLICY_CACHE_TTL = 3600
+
+
+def _get_active_policy_ref():
+    """Return ``{'id', 'name'}`` of the active policy, cached in Redis."""
+    ref = cache.get(ACTIVE_POLICY_CACHE_KEY)
+    if ref is None:
+        active_policy = PolicyConfiguration.objects.filter(is_active=True).first()
+        if not active_policy:
+            return None
+        ref = {'id': str(active_policy.id), 'name': active_policy.name}
+        cache.set(ACTIVE_POLICY_CACHE_KEY, ref, timeout=ACTIVE_POLICY_CACHE_TTL)
+    return ref
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -109,6 +128,14 @@ class PatientViewSet(viewsets.ModelViewSet):
     search_fields = ['patient_id', 'note']
     ordering_fields = ['patient_id', 'age', 'visits_last_year', 'created_at']
     
+    def get_queryset(self):
+        if self.action == 'list':
+            # PatientListSerializer does not include the note
+            return Patient.list_qs()
+        if self.action == 'retrieve':
+            return Patient.with_recent_assessments(limit=10)
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return PatientDetailSerializer
@@ -117,7 +144,9 @@ class PatientViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def risk_history(self, request, pk=None):
         patient = self.get_object()
-        assessments = patient.risk_assessments.order_by('-created_at')
+        assessments = patient.risk_assessments.select_related(
+            'patient_card', 'detail'
+        ).order_by('-created_at')
         serializer = RiskAssessmentSerializer(assessments, many=True)
         return Response(serializer.data)
     
@@ -138,12 +167,20 @@ class PatientViewSet(viewsets.ModelViewSet):
         })
 
 
-class RiskAssessmentViewSet(viewsets.ModelViewSet):
-    queryset = RiskAssessment.objects.select_related('patient').all()
+class RiskAssessmentViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = RiskAssessment.objects.select_related('patient_card', 'detail')
     serializer_class = RiskAssessmentSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['action', 'autonomy_level', 'run_id']
     ordering_fields = ['risk_score', 'created_at', 'flag_count']
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        flag = self.request.query_params.get('flag')
+        if flag:
+            # jsonb containment, served by the ra_flags_gin index
+            qs = qs.filter(flags__contains=[flag])
+        return qs
     
     @action(detail=True, methods=['post'])
     def review(self, request, pk=None):
@@ -179,6 +216,31 @@ class RiskAssessmentViewSet(viewsets.ModelViewSet):
             details={'review_notes': assessment.review_notes}
         )
         return Response(RiskAssessmentSerializer(assessment).data)
+
+    @action(detail=False, methods=['post'])
+    def bulk_review(self, request):
+        serializer = BulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reviewer = serializer.validated_data['reviewed_by']
+        notes = serializer.validated_data['review_notes']
+
+        ids = list(
+            RiskAssessment.raw_objects.filter(
+                id__in=serializer.validated_data['assessment_ids']
+            ).values_list('id', flat=True)
+        )
+        updated = RiskAssessment.bulk_mark_reviewed(ids, reviewer, notes)
+        AuditLog.objects.bulk_create([
+            AuditLog(
+                action_type='MANUAL_REVIEW',
+                actor=reviewer,
+                target_type='RiskAssessment',
+                target_id=str(assessment_id),
+                details={'review_notes': notes},
+            )
+            for assessment_id in ids
+        ])
+        return Response({'reviewed': updated})
     
     @action(detail=False, methods=['get'])
     def high_risk(self, request):
@@ -206,7 +268,8 @@ class PolicyConfigurationViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
         policy = self.get_object()
-        PolicyConfiguration.objects.filter(is_active=True).update(is_active=False)
+        # save() deactivates the previously active policy and clears the
+        # cached active-policy reference
         policy.is_active = True
         policy.save()
         AuditLog.objects.create(
@@ -220,7 +283,7 @@ class PolicyConfigurationViewSet(viewsets.ModelViewSet):
 
 
 class WorkflowRunViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = WorkflowRun.objects.select_related('policy').all()
+    queryset = WorkflowRun.objects.all()
     serializer_class = WorkflowRunSerializer
     
     @action(detail=False, methods=['post'])
@@ -237,22 +300,20 @@ class WorkflowRunViewSet(viewsets.ReadOnlyModelViewSet):
             resolved_policy_id = str(requested_policy_id)
             resolved_policy_name = str(requested_policy_id)
         else:
-            active_policy = PolicyConfiguration.objects.filter(is_active=True).first()
+            active_policy = _get_active_policy_ref()
             if active_policy:
-                resolved_policy_id = str(active_policy.id)
-                resolved_policy_name = active_policy.name
+                resolved_policy_id = active_policy['id']
+                resolved_policy_name = active_policy['name']
             else:
                 resolved_policy_id = 'default (will be created)'
                 resolved_policy_name = 'Default Policy'
 
         # Resolve total patient count for audit when no limit specified
         if patient_limit is None:
-            from patients.models import Patient
             total_patients = Patient.objects.count()
         else:
             total_patients = patient_limit
 
-        from agents.tasks import run_screening_workflow_task
         task = run_screening_workflow_task.delay(
             policy_config_id=policy_config_id,
             patient_limit=patient_limit,
@@ -331,7 +392,6 @@ class ComplianceReportViewSet(viewsets.ReadOnlyModelViewSet):
         run_id = request.data.get('run_id')
         if not run_id:
             return Response({'error': 'run_id required'}, status=400)
-        from analytics.tasks import generate_compliance_report
         task = generate_compliance_report.delay(run_id)
         return Response({'task_id': task.id, 'status': 'generating'})
 
@@ -397,9 +457,15 @@ class DashboardView(APIView):
         
         unread_notifications = Notification.objects.filter(is_read=False).count()
         
-        recent_runs = WorkflowRunSerializer(
-            WorkflowRun.objects.all()[:5], many=True
-        ).data
+        # Fixed field subset rendered by the dashboard table; skips model
+        # hydration and per-field serializer overhead.
+        recent_runs = list(
+            WorkflowRun.objects.values(
+                'id', 'status', 'candidates_found', 'flagged_count',
+                'precision', 'recall', 'created_at',
+                policy_name=F('policy__name'),
+            )[:5]
+        )
         
         return Response({
             'total_patients': total_patients,
@@ -15,7 +15,9 @@ SECRET_KEY = os.environ.get(
 
 DEBUG = os.environ.get('DEBUG', '1') == '1'
 
-ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '*').split(',')
+ALLOWED_HOSTS = tuple(
+    h.strip() for h in os.environ.get('ALLOWED_HOSTS', '*').split(',') if h.strip()
+)
 
 # Application definition
 INSTALLED_APPS = [
@@ -144,10 +146,13 @@ STORAGES = {
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # CORS
-CORS_ALLOWED_ORIGINS = os.environ.get(
-    'CORS_ALLOWED_ORIGINS',
-    'http://localhost:3055,http://108.48.39.238:3055'
-).split(',')
+# Parsed once at import; corsheaders requires a sequence (not a set) here.
+CORS_ALLOWED_ORIGINS = tuple(dict.fromkeys(
+    o.strip() for o in os.environ.get(
+        'CORS_ALLOWED_ORIGINS',
+        'http://localhost:3055,http://108.48.39.238:3055'
+    ).split(',') if o.strip()
+))
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 CORS_ALLOW_CREDENTIALS = True
 
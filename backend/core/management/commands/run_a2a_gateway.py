@@ -1,72 +1,110 @@
 """Management command to run the A2A gateway server."""
-import json
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import uvloop
 from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 from aiohttp import web
 
+from mcp.responses import aiohttp_orjson_response as orjson_response
+
 logger = logging.getLogger('a2a')
 
 
+def run_with_db(func, *args):
+    """
+    Call ``func`` on an executor thread. Worker threads outlive requests, so
+    stale or broken DB connections are discarded before and after each call,
+    as Django does around every request.
+    """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
 class Command(BaseCommand):
     help = 'Run the A2A (Agent-to-Agent) gateway server'
 
     def add_arguments(self, parser):
         parser.add_argument('--host', default='0.0.0.0')
         parser.add_argument('--port', type=int, default=9100)
+        parser.add_argument(
+            '--workers', type=int, default=8,
+            help='Thread pool size for blocking task execution (default: 8)',
+        )
 
     def handle(self, *args, **options):
         host = options['host']
         port = options['port']
         self.stdout.write(f"Starting A2A gateway on {host}:{port}")
-        asyncio.run(self.run_server(host, port))
-
-    async def run_server(self, host, port):
+        # Task execution and orchestration are synchronous (ORM + agent
+        # pipeline), so they run on a bounded pool instead of the event loop.
+        executor = ThreadPoolExecutor(
+            max_workers=options['workers'], thread_name_prefix='a2a-worker'
+        )
+        try:
+            uvloop.run(self.run_server(host, port, executor))
+        finally:
+            executor.shutdown(wait=False)
+
+    async def run_server(self, host, port, executor):
         from a2a.protocol import a2a_gateway
 
         async def handle_list_agents(request):
-            return web.json_response({"agents": a2a_gateway.list_agents()})
+            return orjson_response({"agents": a2a_gateway.list_agents()})
 
         async def handle_get_agent(request):
             agent_id = request.match_info['agent_id']
             agent = a2a_gateway.get_agent(agent_id)
             if not agent:
-                return web.json_response({"error": "Not found"}, status=404)
-            return web.json_response(agent)
+                return orjson_response({"error": "Not found"}, status=404)
+            return orjson_response(agent)
 
         async def handle_create_task(request):
-            body = await request.json()
+            body = await request.json(loads=orjson.loads)
             task = a2a_gateway.create_task(
                 body.get("from_agent", "user"),
                 body["to_agent"],
                 body["action"],
                 body.get("payload", {}),
             )
-            return web.json_response(task.to_dict(), status=201)
+            return orjson_response(task.to_dict(), status=201)
 
         async def handle_execute_task(request):
             task_id = request.match_info['task_id']
-            result = a2a_gateway.execute_task(task_id)
-            return web.json_response(result)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                executor, run_with_db, a2a_gateway.execute_task, task_id
+            )
+            return orjson_response(result)
 
         async def handle_get_task(request):
             task_id = request.match_info['task_id']
             task = a2a_gateway.get_task(task_id)
             if not task:
-                return web.json_response({"error": "Not found"}, status=404)
-            return web.json_response(task)
+                return orjson_response({"error": "Not found"}, status=404)
+            return orjson_response(task)
 
         async def handle_list_tasks(request):
             status_filter = request.query.get("status")
-            return web.json_response({"tasks": a2a_gateway.list_tasks(status_filter)})
+            return orjson_response({"tasks": a2a_gateway.list_tasks(status_filter)})
 
         async def handle_orchestrate(request):
-            body = await request.json()
-            result = a2a_gateway.orchestrate_screening(body.get("patient_id", ""))
-            return web.json_response(result)
+            body = await request.json(loads=orjson.loads)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                executor, run_with_db, a2a_gateway.orchestrate_screening,
+                body.get("patient_id", ""),
+            )
+            return orjson_response(result)
 
         async def handle_health(request):
-            return web.json_response({"status": "healthy", "service": "a2a-gateway"})
+            return orjson_response({"status": "healthy", "service": "a2a-gateway"})
 
         app = web.Application()
         app.router.add_get('/health', handle_health)
@@ -83,4 +121,7 @@ class Command(BaseCommand):
         site = web.TCPSite(runner, host, port)
         await site.start()
         self.stdout.write(self.style.SUCCESS(f"A2A gateway running on {host}:{port}"))
-        await asyncio.Event().wait()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
@@ -1,10 +1,14 @@
 """Management command to run the MCP server."""
-import json
 import asyncio
 import logging
+
+import orjson
+import uvloop
 from django.core.management.base import BaseCommand
 from aiohttp import web
 
+from mcp.responses import aiohttp_orjson_response as orjson_response
+
 logger = logging.getLogger('mcp')
 
 
@@ -19,40 +23,44 @@ class Command(BaseCommand):
         host = options['host']
         port = options['port']
         self.stdout.write(f"Starting MCP server on {host}:{port}")
-        asyncio.run(self.run_server(host, port))
+        uvloop.run(self.run_server(host, port))
 
     async def run_server(self, host, port):
-        from mcp.protocol import mcp_server
+        from mcp.protocol import InvalidParams, mcp_server
 
         async def handle_list_tools(request):
-            return web.json_response({"tools": mcp_server.list_tools()})
+            return web.Response(body=mcp_server.tools_json(), content_type='application/json')
 
         async def handle_list_resources(request):
-            return web.json_response({"resources": mcp_server.list_resources()})
+            return web.Response(body=mcp_server.resources_json(), content_type='application/json')
 
         async def handle_create_session(request):
             session_id = mcp_server.create_session()
-            return web.json_response({"session_id": session_id})
+            return orjson_response({"session_id": session_id})
 
         async def handle_invoke(request):
-            body = await request.json()
+            body = await request.json(loads=orjson.loads)
             result = mcp_server.invoke_tool(
                 body.get("session_id", ""),
                 body.get("tool_name", ""),
-                body.get("arguments", {})
+                body.get("arguments", {}),
+                sync=bool(body.get("sync", False)),
             )
-            return web.json_response(result)
+            return orjson_response(result)
 
         async def handle_read(request):
-            body = await request.json()
-            result = mcp_server.read_resource(
-                body.get("uri", ""),
-                body.get("params", {})
-            )
-            return web.json_response(result)
+            body = await request.json(loads=orjson.loads)
+            try:
+                result = mcp_server.read_resource(
+                    body.get("uri", ""),
+                    body.get("params", {})
+                )
+            except InvalidParams as e:
+                return orjson_response(e.to_dict(), status=400)
+            return orjson_response(result)
 
         async def handle_health(request):
-            return web.json_response({"status": "healthy", "service": "mcp-server"})
+            return orjson_response({"status": "healthy", "service": "mcp-server"})
 
         app = web.Application()
         app.router.add_get('/health', handle_health)
@@ -67,4 +75,7 @@ class Command(BaseCommand):
         site = web.TCPSite(runner, host, port)
         await site.start()
         self.stdout.write(self.style.SUCCESS(f"MCP server running on {host}:{port}"))
-        await asyncio.Event().wait()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
@@ -1,19 +1,29 @@
 """
 Management command: seed_data
 Generates synthetic patient records and a default PolicyConfiguration,
-reproducing the notebook's make_patients() logic and augmented-marker generation.
+reproducing the notebook's make_patients() logic and augmented-marker generation
+in a single vectorized pass.
 
 Usage:
     python manage.py seed_data              # default 2500 patients
     python manage.py seed_data --patients 500
+    python manage.py seed_data --copy       # PostgreSQL COPY instead of bulk_create
+    python manage.py seed_data --jobs 8     # generate batches in 8 processes
 """
 
-import math
-import random
+import csv
+import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 import numpy as np
-from django.core.management.base import BaseCommand
+from scipy.special import expit
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
 
+from core.ids import uuid7
 from patients.models import Patient, PolicyConfiguration
 
 
@@ -71,151 +81,251 @@ LOOKALIKE_PENALTY = {
 }
 
 
+# Penalties aligned with LOOKALIKE_DIAG, so they can be gathered by index
+LOOKALIKE_PEN_ARR = np.array(
+    [LOOKALIKE_PENALTY[d] for d in LOOKALIKE_DIAG], dtype=np.float32
+)
+_LOOKALIKE_NAMES = np.array(LOOKALIKE_DIAG, dtype=object)
+
+# Structured "evidence" weights, aligned with SYMPTOMS
+SYMPTOM_WEIGHTS = np.array([1.6, 1.1, 1.0, 0.8, 0.7, 0.6, 0.4, 0.3], dtype=np.float32)
+
+_OPTIC_NEURITIS = SYMPTOMS.index("optic_neuritis")
+_PARESTHESIA = SYMPTOMS.index("paresthesia")
+_WEAKNESS = SYMPTOMS.index("weakness")
+_GAIT_INSTABILITY = SYMPTOMS.index("gait_instability")
+
+# Patient columns stored on insert (database-generated ones excluded).
+_STORED_FIELDS = [f for f in Patient._meta.concrete_fields if not f.generated]
+
+# Generated Patient fields: every stored column except the id/created_at/
+# updated_at columns inherited from TimeStampedModel.
+_PATIENT_COLUMNS = [
+    f.attname for f in _STORED_FIELDS if f.attname not in ("id", "created_at", "updated_at")
+]
+
+# Patients generated and inserted per round trip; bounds peak memory
+GENERATION_BATCH = 5000
+
+# Single PCG64 generator shared by every draw in this module; the Generator
+# API is cheaper per call than the legacy global RandomState.
+_RNG = np.random.default_rng()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def sigmoid(x):
-    """Numerically stable sigmoid."""
-    if x >= 0:
-        return 1.0 / (1.0 + math.exp(-x))
-    else:
-        exp_x = math.exp(x)
-        return exp_x / (1.0 + exp_x)
+def sample_phrases(rng, phrases, k):
+    """
+    For each row ``i`` draw ``k[i]`` distinct phrases and join them with " ; ".
+
+    Sorting a block of random keys yields a random permutation per row, so
+    taking its first ``k[i]`` columns samples without replacement for every
+    row in one call; strings are only materialised at the final join.
+    """
+    table = np.array(phrases, dtype=object)
+    picks = rng.random((len(k), len(phrases)), dtype=np.float32).argsort(axis=1)
+    out = np.empty(len(k), dtype=object)
+    for kv in np.unique(k):
+        mask = k == kv
+        out[mask] = [" ; ".join(terms) for terms in table[picks[mask, :kv]]]
+    return out
 
 
 # ---------------------------------------------------------------------------
-# Patient generation (mirrors notebook cell 10 exactly)
+# Patient generation (mirrors notebook cell 10, vectorized across patients)
 # ---------------------------------------------------------------------------
 
 
-def make_patient_row(index):
-    """Generate a single synthetic patient dict (same logic as notebook)."""
-    age = int(np.clip(np.random.normal(42, 14), 18, 85))
-    sex = np.random.choice(["F", "M"], p=[0.62, 0.38])
-    visits_last_year = int(np.clip(np.random.poisson(3), 0, 15))
-    lookalike = np.random.choice(LOOKALIKE_DIAG, p=LOOKALIKE_PROBS)
+def make_patients_vectorized(n, start=0, rng=_RNG):
+    """
+    Generate ``n`` synthetic patients (same logic as notebook) as a dict of
+    length-``n`` column arrays keyed by Patient field name.
+
+    Every column is drawn for all patients at once and stays columnar; use
+    build_patients() to get model instances. Intermediate numerics are float32:
+    the stored values are rounded to a few decimals anyway.
+    """
+    age = np.clip(
+        42 + 14 * rng.standard_normal(n, dtype=np.float32), 18, 85
+    ).astype(np.int32)
+    sex = rng.choice(["F", "M"], size=n, p=[0.62, 0.38])
+    visits_last_year = np.clip(rng.poisson(3, n), 0, 15)
+    lookalike_idx = rng.choice(len(LOOKALIKE_DIAG), size=n, p=LOOKALIKE_PROBS)
+
+    # Every uniform draw of the batch comes from one buffer: the first
+    # len(SYMPTOMS) rows feed the symptom flags, the rest one Bernoulli each.
+    uniforms = rng.random((len(SYMPTOMS) + 9, n), dtype=np.float32)
+    (
+        u_pattern_on, u_paresthesia, u_pattern_gait, u_weakness,
+        u_note, u_mri, u_lesions, u_at_risk, u_mono,
+    ) = uniforms[len(SYMPTOMS):]
 
     # Symptom probabilities (roughly plausible, not clinical)
-    symptom_base = 0.08 + 0.03 * (sex == "F") + 0.01 * (age < 55)
-    symptoms = {s: int(np.random.rand() < symptom_base) for s in SYMPTOMS}
+    symptom_base = (0.08 + 0.03 * (sex == "F") + 0.01 * (age < 55)).astype(np.float32)
+    symptoms = (uniforms[: len(SYMPTOMS)] < symptom_base).T.astype(np.int8)
 
     # Correlated symptom patterns
-    if np.random.rand() < 0.05:
-        symptoms["optic_neuritis"] = 1
-        symptoms["paresthesia"] = int(np.random.rand() < 0.65)
-    if np.random.rand() < 0.06:
-        symptoms["gait_instability"] = 1
-        symptoms["weakness"] = int(np.random.rand() < 0.5)
+    mask = u_pattern_on < 0.05
+    symptoms[mask, _OPTIC_NEURITIS] = 1
+    symptoms[mask, _PARESTHESIA] = u_paresthesia[mask] < 0.65
+    mask = u_pattern_gait < 0.06
+    symptoms[mask, _GAIT_INSTABILITY] = 1
+    symptoms[mask, _WEAKNESS] = u_weakness[mask] < 0.5
 
     # Structured "evidence" signal
-    struct_signal = (
-        1.6 * symptoms["optic_neuritis"]
-        + 1.1 * symptoms["paresthesia"]
-        + 1.0 * symptoms["weakness"]
-        + 0.8 * symptoms["gait_instability"]
-        + 0.7 * symptoms["vertigo"]
-        + 0.6 * symptoms["fatigue"]
-        + 0.4 * symptoms["bladder_issues"]
-        + 0.3 * symptoms["cognitive_fog"]
-    )
+    struct_signal = symptoms.astype(np.float32) @ SYMPTOM_WEIGHTS
 
-    lookalike_pen = LOOKALIKE_PENALTY[lookalike]
+    lookalike_pen = LOOKALIKE_PEN_ARR[lookalike_idx]
 
     # Note generation
-    note_ms_prob = sigmoid(struct_signal - lookalike_pen - 1.2)
-    note_has_ms_terms = int(np.random.rand() < note_ms_prob)
+    note_ms_prob = expit(struct_signal - lookalike_pen - 1.2)
+    note_has_ms_terms = u_note < note_ms_prob
 
-    note_terms = []
-    if note_has_ms_terms:
-        note_terms += random.sample(NOTE_PHRASES_MS, k=random.randint(1, 3))
-    else:
-        note_terms += random.sample(NOTE_PHRASES_NONMS, k=random.randint(1, 3))
-    note = " ; ".join(note_terms)
+    n_terms = rng.integers(1, 4, size=n)
+    note = np.empty(n, dtype=object)
+    note[note_has_ms_terms] = sample_phrases(
+        rng, NOTE_PHRASES_MS, n_terms[note_has_ms_terms]
+    )
+    note[~note_has_ms_terms] = sample_phrases(
+        rng, NOTE_PHRASES_NONMS, n_terms[~note_has_ms_terms]
+    )
 
     # MRI report availability
-    has_mri = int(
-        np.random.rand()
-        < (0.20 + 0.10 * symptoms["optic_neuritis"] + 0.05 * visits_last_year / 10)
-    )
-    mri_lesions = int(has_mri and (np.random.rand() < sigmoid(struct_signal - 1.0)))
+    mri_prob = (
+        0.20
+        + 0.10 * symptoms[:, _OPTIC_NEURITIS]
+        + 0.05 * visits_last_year / 10
+    ).astype(np.float32)
+    has_mri = u_mri < mri_prob
+    mri_lesions = has_mri & (u_lesions < expit(struct_signal - 1.0))
 
     # Ground truth
-    risk_latent = sigmoid(
+    risk_latent = expit(
         struct_signal
-        + 0.9 * note_has_ms_terms
-        + 0.8 * mri_lesions
+        + 0.9 * note_has_ms_terms.astype(np.float32)
+        + 0.8 * mri_lesions.astype(np.float32)
         - lookalike_pen
         - 1.6
     )
-    at_risk = int(np.random.rand() < risk_latent)
+    at_risk = u_at_risk < risk_latent
+    at_risk_f = at_risk.astype(np.float32)
+
+    # Augmented markers (mirrors notebook cell 48). Stored values are rounded
+    # from float64 so they keep exact decimal representations.
+    # Vitamin D (ng/mL): lower on average for higher-risk in this synthetic world
+    base_vitd = np.clip(rng.normal(28, 10, n), 5, 80)
+    vitamin_d = np.clip(
+        base_vitd - 6.0 * at_risk_f + rng.normal(0, 3, n), 5, 80
+    ).round(2)
+
+    # EBV / mono history (binary), correlated with risk
+    mono_history = u_mono < (0.10 + 0.18 * at_risk_f)
+
+    # Smartform-like structured symptom score: compress symptom evidence
+    symptom_sum = symptoms.sum(axis=1, dtype=np.int8)
+    smartform_score = np.clip(symptom_sum + rng.normal(0, 0.75, n), 0, 8).round(4)
+
+    # PATHS-like performance score (lower => worse function)
+    paths_score = np.clip(
+        100 - 6 * at_risk_f - 0.15 * age + rng.normal(0, 6, n), 0, 100
+    ).round(4)
 
     return {
-        "patient_id": f"P{index:05d}",
+        "patient_id": np.array([f"P{i:05d}" for i in range(start, start + n)], dtype=object),
         "age": age,
         "sex": sex,
         "visits_last_year": visits_last_year,
-        "lookalike_dx": lookalike,
+        "lookalike_dx": _LOOKALIKE_NAMES[lookalike_idx],
         "note": note,
-        "has_mri": bool(has_mri),
-        "mri_lesions": bool(mri_lesions),
-        "note_has_ms_terms": bool(note_has_ms_terms),
-        "true_at_risk": bool(at_risk),
-        **{s: bool(v) for s, v in symptoms.items()},
+        "has_mri": has_mri,
+        "mri_lesions": mri_lesions,
+        "note_has_ms_terms": note_has_ms_terms,
+        "true_at_risk": at_risk,
+        "vitamin_d_ngml": vitamin_d,
+        "vitamin_d_deficient": vitamin_d < 20.0,
+        "infectious_mono_history": mono_history,
+        "smartform_neuro_symptom_score": smartform_score,
+        "paths_like_function_score": paths_score,
+        **{s: symptoms[:, j].astype(bool) for j, s in enumerate(SYMPTOMS)},
     }
 
 
-# ---------------------------------------------------------------------------
-# Augmented marker generation (mirrors notebook cell 48)
-# ---------------------------------------------------------------------------
+def build_patients(columns):
+    """
+    Construct unsaved Patient instances from a make_patients_vectorized() dict.
+
+    Values are passed by field name, so the loader does not depend on the
+    order in which Patient and TimeStampedModel declare their fields.
+    """
+    values = [columns[name].tolist() for name in _PATIENT_COLUMNS]
+    now = timezone.now()
+    return [
+        Patient(id=uuid7(), created_at=now, updated_at=now, **dict(zip(_PATIENT_COLUMNS, row)))
+        for row in zip(*values)
+    ]
 
 
-def augment_patient(row):
+def iter_patient_batches(n, batch=GENERATION_BATCH, jobs=1):
     """
-    Add vitamin D, mono history, smartform score, PATHS-like score.
-    Mutates and returns the same dict.
+    Yield the ``n`` patients as successive column dicts of at most ``batch``
+    rows, so callers can insert each one before the next is generated.
+
+    With ``jobs > 1`` batches are generated in worker processes, each with
+    its own child Generator spawned from the module stream; batches are still
+    yielded in order.
     """
-    at_risk_int = int(row["true_at_risk"])
-    age = row["age"]
+    starts = range(0, n, batch)
+    sizes = [min(batch, n - start) for start in starts]
+    if jobs <= 1:
+        for start, size in zip(starts, sizes):
+            yield make_patients_vectorized(size, start=start)
+        return
+
+    # Executor.map() would submit every batch up front and buffer results the
+    # caller has not consumed yet; keep only a couple of batches per worker
+    # in flight so memory stays O(batch) in the parallel path too.
+    tasks = zip(sizes, starts, _RNG.spawn(len(sizes)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque(
+            pool.submit(make_patients_vectorized, *task)
+            for task in islice(tasks, 2 * jobs)
+        )
+        while pending:
+            columns = pending.popleft().result()
+            for task in islice(tasks, 1):
+                pending.append(pool.submit(make_patients_vectorized, *task))
+            yield columns
 
-    # Vitamin D (ng/mL): lower on average for higher-risk in this synthetic world
-    base_vitd = float(np.clip(np.random.normal(28, 10), 5, 80))
-    risk_influence = 6.0 * at_risk_int
-    row["vitamin_d_ngml"] = round(
-        float(
-            np.clip(
-                base_vitd - risk_influence + np.random.normal(0, 3), 5, 80
-            )
-        ),
-        2,
-    )
-    row["vitamin_d_deficient"] = row["vitamin_d_ngml"] < 20.0
 
-    # EBV / mono history (binary), correlated with risk
-    row["infectious_mono_history"] = bool(
-        np.random.rand() < (0.10 + 0.18 * at_risk_int)
-    )
+# ---------------------------------------------------------------------------
+# PostgreSQL COPY loader
+# ---------------------------------------------------------------------------
 
-    # Smartform-like structured symptom score: compress symptom evidence
-    symptom_sum = sum(1 for s in SYMPTOMS if row.get(s))
-    row["smartform_neuro_symptom_score"] = round(
-        float(np.clip(symptom_sum + np.random.normal(0, 0.75), 0, 8)), 4
-    )
 
-    # PATHS-like performance score (lower => worse function)
-    row["paths_like_function_score"] = round(
-        float(
-            np.clip(
-                100 - 6 * at_risk_int - 0.15 * age + np.random.normal(0, 6),
-                0,
-                100,
-            )
-        ),
-        4,
-    )
+def copy_patients(columns):
+    """
+    Stream a column dict into the Patient table with ``COPY ... FROM STDIN``.
+
+    Skips model instantiation entirely; primary keys are generated here and
+    the timestamp columns are left to their database defaults. PostgreSQL only.
+    """
+    fields = [Patient._meta.pk] + [Patient._meta.get_field(name) for name in _PATIENT_COLUMNS]
+    n = len(columns["patient_id"])
+
+    values = [[uuid7() for _ in range(n)]]
+    values += [columns[name].tolist() for name in _PATIENT_COLUMNS]
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(zip(*values))
+    buf.seek(0)
 
-    return row
+    table = connection.ops.quote_name(Patient._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
 
 
 # ---------------------------------------------------------------------------
@@ -233,9 +343,22 @@ class Command(BaseCommand):
             default=2500,
             help="Number of synthetic patients to generate (default: 2500)",
         )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Load patients with PostgreSQL COPY instead of bulk_create",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Worker processes for patient generation (default: 1)",
+        )
 
     def handle(self, *args, **options):
         n_patients = options["patients"]
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy requires a PostgreSQL database.")
 
         # -----------------------------------------------------------------
         # Guard: skip if patients already exist
@@ -250,16 +373,24 @@ class Command(BaseCommand):
         else:
             self.stdout.write(f"Generating {n_patients} synthetic patients ...")
 
-            patients_to_create = []
-            for i in range(n_patients):
-                row = make_patient_row(i)
-                row = augment_patient(row)
-                patients_to_create.append(Patient(**row))
-
-            Patient.objects.bulk_create(patients_to_create, batch_size=500)
-
+            # One transaction for the whole load: a failure leaves no partial
+            # seed behind, and the per-batch commits are avoided.
+            with transaction.atomic():
+                for columns in iter_patient_batches(n_patients, jobs=options["jobs"]):
+                    if options["copy"]:
+                        copy_patients(columns)
+                    else:
+                        Patient.objects.bulk_create(
+                            build_patients(columns),
+                            batch_size=GENERATION_BATCH,
+                            ignore_conflicts=True,
+                        )
+
+            # ignore_conflicts skips duplicate patient_ids silently, so report
+            # the rows actually stored rather than the number requested.
+            created = Patient.objects.count() - existing_count
             self.stdout.write(
-                self.style.SUCCESS(f"Created {n_patients} patients.")
+                self.style.SUCCESS(f"Created {created} of {n_patients} patients.")
             )
 
         # -----------------------------------------------------------------
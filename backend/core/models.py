@@ -1,13 +1,25 @@
 """Core models shared across the application."""
-import uuid
 from django.db import models
+from django.db.models.functions import Now
+
+from .ids import uuid7
 
 
 class TimeStampedModel(models.Model):
-    """Abstract base model with created/updated timestamps."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    """
+    Abstract base model with created/updated timestamps.
+
+    Both columns default to now() in the database, so rows inserted without
+    them (bulk loads, COPY, raw SQL) are stamped server-side; save() still
+    refreshes updated_at. Primary keys are time-ordered uuid7 values
+    assigned client-side, including by the COPY loaders.
+
+    created_at has no index of its own; subclasses index it in the
+    composites their queries need.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     class Meta:
         abstract = True
@@ -26,7 +38,7 @@ class AuditLog(TimeStampedModel):
         ('ALERT', 'Alert Generated'),
     ]
 
-    action_type = models.CharField(max_length=50, choices=ACTION_TYPES, db_index=True)
+    action_type = models.CharField(max_length=50, choices=ACTION_TYPES)
     actor = models.CharField(max_length=200, default='system')
     target_type = models.CharField(max_length=100, blank=True)
     target_id = models.CharField(max_length=200, blank=True)
@@ -35,6 +47,14 @@ class AuditLog(TimeStampedModel):
 
     class Meta(TimeStampedModel.Meta):
         verbose_name_plural = 'Audit Logs'
+        # Serves action_type filters together with the default -created_at
+        # ordering; also covers plain action_type lookups, so that column
+        # needs no index of its own.
+        indexes = [
+            models.Index(fields=['action_type', '-created_at'], name='auditlog_action_created'),
+            # unfiltered audit trail, newest first
+            models.Index(fields=['-created_at'], name='auditlog_created'),
+        ]
 
     def __str__(self):
         return f"{self.action_type} by {self.actor} at {self.created_at}"
@@ -68,5 +88,11 @@ class Notification(TimeStampedModel):
     related_patient_id = models.CharField(max_length=50, blank=True)
     metadata = models.JSONField(default=dict)
 
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            # notification feed, newest first
+            models.Index(fields=['-created_at'], name='notification_created'),
+        ]
+
     def __str__(self):
         return f"[{self.severity}] {self.title}"
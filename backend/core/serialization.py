@@ -0,0 +1,37 @@
+"""orjson-backed codecs for model JSONFields."""
+import json
+
+import orjson
+
+# OPT_NON_STR_KEYS matches the stdlib's coercion of int/float dict keys.
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonEncoder(json.JSONEncoder):
+    """
+    ``JSONField(encoder=...)`` that serializes with orjson.
+
+    Indented output (the admin's JSON form widget) still goes through the
+    stdlib encoder, which orjson cannot reproduce for arbitrary indents.
+    """
+
+    def encode(self, o):
+        if self.indent is not None:
+            return super().encode(o)
+        return orjson.dumps(o, option=_OPTIONS).decode()
+
+
+class OrjsonDecoder(json.JSONDecoder):
+    """
+    ``JSONField(decoder=...)`` that parses with orjson.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so Django's
+    fallback for non-JSON values behaves as with the stdlib decoder.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Skip building the stdlib scanner; decode() never uses it.
+        pass
+
+    def decode(self, s, *args):
+        return orjson.loads(s)
@@ -1,11 +1,12 @@
 """Governance and compliance models."""
-import uuid
 from django.db import models
 
+from core.ids import uuid7
+
 
 class GovernanceRule(models.Model):
     """Configurable governance rules for the safety agent."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=200, unique=True)
     description = models.TextField()
     rule_type = models.CharField(max_length=50, choices=[
@@ -36,7 +37,7 @@ class GovernanceRule(models.Model):
 
 class ComplianceReport(models.Model):
     """Generated compliance/audit reports."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     report_type = models.CharField(max_length=50, choices=[
         ('FAIRNESS', 'Fairness Analysis'),
         ('SAFETY', 'Safety Audit'),
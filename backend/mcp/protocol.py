@@ -7,17 +7,89 @@ MCP provides a standardized way for AI agents to:
 - Maintain conversation state across agent interactions
 - Enforce governance and safety constraints on agent actions
 """
-import json
-import uuid
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field, asdict
+import secrets
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from dataclasses import dataclass, field
+
+import orjson
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from agents.coordinator import Coordinator
+from agents.llm_agent import llm_summarize_note
+from agents.notes_imaging import NotesImagingAgent
+from agents.phenotyping import PhenotypingAgentV2
+from agents.safety import SafetyGovernanceAgent
+from agents.tasks import run_screening_workflow_task
+from analytics.services import (
+    compute_workflow_metrics, subgroup_analysis, what_if_analysis
+)
+from governance.models import GovernanceRule
+from patients.models import Patient, RiskAssessment, PolicyConfiguration
+
+from .tasks import execute_mcp_tool_task
 
 logger = logging.getLogger('mcp')
 
+# Sessions live in the shared cache (Redis) so every worker process sees the
+# same state; idle sessions expire after SESSION_TTL seconds.
+SESSION_CACHE_PREFIX = 'mcp:session:'
+SESSION_TTL = 3600
+# Per-session message history is trimmed to the most recent entries
+MAX_SESSION_MESSAGES = 100
+# Upper bound on the rows one paged resource read may return
+MAX_RESOURCE_LIMIT = 1000
 
-@dataclass
+# Tools that run the agent pipeline or call the LLM; unless invoked with
+# sync=True they are queued on Celery and polled with get_tool_result.
+QUEUED_TOOLS = frozenset({"screen_patient", "summarize_note"})
+
+# Patient columns read by the screen_patient agent pipeline
+SCREEN_PATIENT_FIELDS = (
+    'patient_id', 'age', 'sex', 'note', 'has_mri', 'mri_lesions',
+    'note_has_ms_terms', 'optic_neuritis', 'paresthesia', 'weakness',
+    'gait_instability', 'vertigo', 'fatigue', 'bladder_issues', 'cognitive_fog',
+    'lookalike_dx', 'vitamin_d_deficient', 'infectious_mono_history',
+    'smartform_neuro_symptom_score', 'paths_like_function_score',
+    'visits_last_year',
+)
+
+# Tool results carry numpy scalars from the scoring agents and may be keyed
+# by non-string group values.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    # Only reached for types orjson has no native encoder for
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(obj) -> bytes:
+    """Encode ``obj`` the way every MCP payload is encoded."""
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+class InvalidParams(ValueError):
+    """Malformed request parameters (JSON-RPC error -32602)."""
+    code = -32602
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"error": {"code": self.code, "message": str(self)}}
+
+
+def _new_id() -> str:
+    """Random 128-bit hex id for sessions and messages."""
+    return secrets.token_hex(16)
+
+
+@dataclass(slots=True, frozen=True)
 class MCPResource:
     """A resource that can be accessed through MCP."""
     uri: str
@@ -27,34 +99,207 @@ class MCPResource:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self):
-        return asdict(self)
+        # Built by hand rather than with asdict(), which deep-copies every field
+        return {
+            "uri": self.uri,
+            "name": self.name,
+            "description": self.description,
+            "mime_type": self.mime_type,
+            "metadata": self.metadata,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """A tool that can be invoked through MCP."""
     name: str
     description: str
     input_schema: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Tool definitions are static, so the listing entry is built once and
+        # shared by every list_tools() call instead of being copied per call.
+        object.__setattr__(self, "_dict", {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+            "metadata": self.metadata,
+        })
 
     def to_dict(self):
-        return asdict(self)
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPMessage:
     """A message in the MCP protocol."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     role: str = "assistant"
     content: str = ""
     tool_calls: List[Dict[str, Any]] = field(default_factory=list)
     tool_results: List[Dict[str, Any]] = field(default_factory=list)
     context: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Unix epoch seconds; callers format it only if they display it
+    timestamp: float = field(default_factory=time.time)
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "id": self.id,
+            "role": self.role,
+            "content": self.content,
+            "tool_calls": self.tool_calls,
+            "tool_results": self.tool_results,
+            "context": self.context,
+            "timestamp": self.timestamp,
+        }
+
+
+# Built-in healthcare agent tools; frozen, so one set of instances is shared
+DEFAULT_TOOLS = (
+    MCPTool(
+        name="screen_patient",
+        description="Run MS risk screening on a specific patient using the multi-agent pipeline",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "patient_id": {"type": "string", "description": "Patient identifier (e.g., P00001)"},
+            },
+            "required": ["patient_id"]
+        }
+    ),
+    MCPTool(
+        name="run_screening_workflow",
+        description="Execute full screening workflow across all patients with specified policy",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "policy_id": {"type": "string", "description": "Policy configuration UUID"},
+                "patient_limit": {"type": "integer", "description": "Max patients to screen"},
+            },
+        }
+    ),
+    MCPTool(
+        name="get_patient_risk_card",
+        description="Generate detailed risk explanation card for a patient",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "patient_id": {"type": "string"},
+                "run_id": {"type": "string"},
+            },
+            "required": ["patient_id"]
+        }
+    ),
+    MCPTool(
+        name="analyze_fairness",
+        description="Run fairness analysis on screening results by demographic group",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Workflow run UUID"},
+                "group_by": {
+                    "type": "string",
+                    "enum": ["sex", "age_band", "lookalike_dx"],
+                    "description": "Grouping variable for fairness analysis"
+                },
+            },
+            "required": ["run_id", "group_by"]
+        }
+    ),
+    MCPTool(
+        name="what_if_policy",
+        description="Run what-if analysis with alternative policy thresholds",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string"},
+                "risk_review_threshold": {"type": "number"},
+                "draft_order_threshold": {"type": "number"},
+                "auto_order_threshold": {"type": "number"},
+                "max_auto_actions_per_day": {"type": "integer"},
+            },
+            "required": ["run_id"]
+        }
+    ),
+    MCPTool(
+        name="review_assessment",
+        description="Submit clinician review for a risk assessment",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "assessment_id": {"type": "string"},
+                "reviewed_by": {"type": "string"},
+                "review_notes": {"type": "string"},
+                "override_action": {"type": "string"},
+            },
+            "required": ["assessment_id", "reviewed_by"]
+        }
+    ),
+    MCPTool(
+        name="get_workflow_metrics",
+        description="Get comprehensive metrics for a workflow run",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string"},
+            },
+            "required": ["run_id"]
+        }
+    ),
+    MCPTool(
+        name="summarize_note",
+        description="Use LLM to summarize a clinical note for MS evidence",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "patient_id": {"type": "string"},
+            },
+            "required": ["patient_id"]
+        }
+    ),
+    MCPTool(
+        name="get_tool_result",
+        description="Fetch the status and result of a queued tool invocation",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "task_id": {"type": "string", "description": "Task id returned when the tool was queued"},
+            },
+            "required": ["task_id"]
+        }
+    ),
+)
+
+# Built-in data resources
+DEFAULT_RESOURCES = (
+    MCPResource(
+        uri="msrisk://patients",
+        name="Patient Registry",
+        description="Access to the patient population database"
+    ),
+    MCPResource(
+        uri="msrisk://assessments",
+        name="Risk Assessments",
+        description="Historical risk assessment results"
+    ),
+    MCPResource(
+        uri="msrisk://policies",
+        name="Policy Configurations",
+        description="Screening policy threshold configurations"
+    ),
+    MCPResource(
+        uri="msrisk://governance",
+        name="Governance Rules",
+        description="Safety and governance rule definitions"
+    ),
+    MCPResource(
+        uri="msrisk://analytics",
+        name="Analytics Dashboard",
+        description="Aggregated metrics and fairness data"
+    ),
+)
 
 
 class MCPServer:
@@ -70,147 +315,42 @@ class MCPServer:
     def __init__(self):
         self._tools: Dict[str, MCPTool] = {}
         self._resources: Dict[str, MCPResource] = {}
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # Encoded listing payloads, built on first request and dropped on
+        # registration; tools and resources are static after startup.
+        self._tools_json: Optional[bytes] = None
+        self._resources_json: Optional[bytes] = None
+        # Tool name -> bound handler, built once so dispatch is a dict lookup
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "screen_patient": self._tool_screen_patient,
+            "run_screening_workflow": self._tool_run_screening_workflow,
+            "get_patient_risk_card": self._tool_get_patient_risk_card,
+            "analyze_fairness": self._tool_analyze_fairness,
+            "what_if_policy": self._tool_what_if_policy,
+            "review_assessment": self._tool_review_assessment,
+            "get_workflow_metrics": self._tool_get_workflow_metrics,
+            "summarize_note": self._tool_summarize_note,
+            "get_tool_result": self._tool_get_tool_result,
+        }
         self._register_default_tools()
         self._register_default_resources()
 
     def _register_default_tools(self):
         """Register all available healthcare agent tools."""
-        self.register_tool(MCPTool(
-            name="screen_patient",
-            description="Run MS risk screening on a specific patient using the multi-agent pipeline",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "patient_id": {"type": "string", "description": "Patient identifier (e.g., P00001)"},
-                },
-                "required": ["patient_id"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="run_screening_workflow",
-            description="Execute full screening workflow across all patients with specified policy",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "policy_id": {"type": "string", "description": "Policy configuration UUID"},
-                    "patient_limit": {"type": "integer", "description": "Max patients to screen"},
-                },
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="get_patient_risk_card",
-            description="Generate detailed risk explanation card for a patient",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "patient_id": {"type": "string"},
-                    "run_id": {"type": "string"},
-                },
-                "required": ["patient_id"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="analyze_fairness",
-            description="Run fairness analysis on screening results by demographic group",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "run_id": {"type": "string", "description": "Workflow run UUID"},
-                    "group_by": {
-                        "type": "string",
-                        "enum": ["sex", "age_band", "lookalike_dx"],
-                        "description": "Grouping variable for fairness analysis"
-                    },
-                },
-                "required": ["run_id", "group_by"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="what_if_policy",
-            description="Run what-if analysis with alternative policy thresholds",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "run_id": {"type": "string"},
-                    "risk_review_threshold": {"type": "number"},
-                    "draft_order_threshold": {"type": "number"},
-                    "auto_order_threshold": {"type": "number"},
-                    "max_auto_actions_per_day": {"type": "integer"},
-                },
-                "required": ["run_id"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="review_assessment",
-            description="Submit clinician review for a risk assessment",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "assessment_id": {"type": "string"},
-                    "reviewed_by": {"type": "string"},
-                    "review_notes": {"type": "string"},
-                    "override_action": {"type": "string"},
-                },
-                "required": ["assessment_id", "reviewed_by"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="get_workflow_metrics",
-            description="Get comprehensive metrics for a workflow run",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "run_id": {"type": "string"},
-                },
-                "required": ["run_id"]
-            }
-        ))
-        self.register_tool(MCPTool(
-            name="summarize_note",
-            description="Use LLM to summarize a clinical note for MS evidence",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "patient_id": {"type": "string"},
-                },
-                "required": ["patient_id"]
-            }
-        ))
+        for tool in DEFAULT_TOOLS:
+            self.register_tool(tool)
 
     def _register_default_resources(self):
         """Register available data resources."""
-        self.register_resource(MCPResource(
-            uri="msrisk://patients",
-            name="Patient Registry",
-            description="Access to the patient population database"
-        ))
-        self.register_resource(MCPResource(
-            uri="msrisk://assessments",
-            name="Risk Assessments",
-            description="Historical risk assessment results"
-        ))
-        self.register_resource(MCPResource(
-            uri="msrisk://policies",
-            name="Policy Configurations",
-            description="Screening policy threshold configurations"
-        ))
-        self.register_resource(MCPResource(
-            uri="msrisk://governance",
-            name="Governance Rules",
-            description="Safety and governance rule definitions"
-        ))
-        self.register_resource(MCPResource(
-            uri="msrisk://analytics",
-            name="Analytics Dashboard",
-            description="Aggregated metrics and fairness data"
-        ))
+        for resource in DEFAULT_RESOURCES:
+            self.register_resource(resource)
 
     def register_tool(self, tool: MCPTool):
         self._tools[tool.name] = tool
+        self._tools_json = None
 
     def register_resource(self, resource: MCPResource):
         self._resources[resource.uri] = resource
+        self._resources_json = None
 
     def list_tools(self) -> List[Dict[str, Any]]:
         return [t.to_dict() for t in self._tools.values()]
@@ -218,43 +358,79 @@ class MCPServer:
     def list_resources(self) -> List[Dict[str, Any]]:
         return [r.to_dict() for r in self._resources.values()]
 
+    def tools_json(self) -> bytes:
+        """The ``{"tools": [...]}`` listing, JSON-encoded once and reused."""
+        if self._tools_json is None:
+            self._tools_json = json_dumps({"tools": self.list_tools()})
+        return self._tools_json
+
+    def resources_json(self) -> bytes:
+        """The ``{"resources": [...]}`` listing, JSON-encoded once and reused."""
+        if self._resources_json is None:
+            self._resources_json = json_dumps({"resources": self.list_resources()})
+        return self._resources_json
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"{SESSION_CACHE_PREFIX}{session_id}"
+
     def create_session(self) -> str:
-        session_id = str(uuid.uuid4())
-        self._sessions[session_id] = {
+        session_id = _new_id()
+        cache.set(self._session_key(session_id), {
             'id': session_id,
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': time.time(),
             'messages': [],
             'context': {},
-        }
+        }, timeout=SESSION_TTL)
         logger.info(f"MCP session created: {session_id}")
         return session_id
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        return self._sessions.get(session_id)
-
-    def invoke_tool(self, session_id: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Invoke a registered tool and return the result."""
+        return cache.get(self._session_key(session_id))
+
+    def _record_message(self, session_id: str, message: Dict[str, Any]):
+        """Append to a session's history under a lock shared by all workers."""
+        key = self._session_key(session_id)
+        with cache.lock(f"{key}:lock", timeout=10):
+            session = cache.get(key)
+            if session is None:
+                return
+            session['messages'].append(message)
+            del session['messages'][:-MAX_SESSION_MESSAGES]
+            cache.set(key, session, timeout=SESSION_TTL)
+
+    def invoke_tool(self, session_id: str, tool_name: str, arguments: Dict[str, Any],
+                    sync: bool = False) -> Dict[str, Any]:
+        """
+        Invoke a registered tool and return the result.
+
+        Tools in QUEUED_TOOLS are handed to Celery and return a task id
+        immediately, unless ``sync`` asks for the result inline.
+        """
         if tool_name not in self._tools:
             return {"error": f"Tool '{tool_name}' not found"}
 
-        session = self._sessions.get(session_id)
-        if not session:
+        # touch() both refreshes the TTL and tells us whether the session exists
+        if not session_id or not cache.touch(self._session_key(session_id), SESSION_TTL):
             session_id = self.create_session()
-            session = self._sessions[session_id]
 
         logger.info(f"MCP tool invocation: {tool_name} with args {arguments}")
 
         try:
-            result = self._execute_tool(tool_name, arguments)
-            
+            if tool_name in QUEUED_TOOLS and not sync:
+                task = execute_mcp_tool_task.delay(tool_name, arguments)
+                result = {"task_id": task.id, "status": "queued"}
+            else:
+                result = self._execute_tool(tool_name, arguments)
+
             # Record in session
-            session['messages'].append(MCPMessage(
+            self._record_message(session_id, MCPMessage(
                 role="tool",
-                content=json.dumps(result),
+                content=json_dumps(result).decode(),
                 tool_calls=[{"name": tool_name, "arguments": arguments}],
                 tool_results=[result],
             ).to_dict())
-            
+
             return {"success": True, "result": result, "session_id": session_id}
         except Exception as e:
             logger.error(f"MCP tool error: {tool_name} - {e}")
@@ -262,149 +438,183 @@ class MCPServer:
 
     def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute the actual tool logic."""
-        from patients.models import Patient, RiskAssessment, WorkflowRun, PolicyConfiguration
-        from analytics.services import (
-            compute_workflow_metrics, subgroup_analysis, what_if_analysis
+        handler = self._handlers.get(tool_name)
+        if handler is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        return handler(arguments)
+
+    def _tool_screen_patient(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        # Fetch only the scored columns, straight into a dict
+        patient_data = Patient.objects.values(*SCREEN_PATIENT_FIELDS).get(
+            patient_id=arguments['patient_id']
         )
-        from agents.llm_agent import llm_summarize_note
-
-        if tool_name == "screen_patient":
-            patient = Patient.objects.get(patient_id=arguments['patient_id'])
-            from agents.phenotyping import PhenotypingAgentV2
-            from agents.notes_imaging import NotesImagingAgent
-            from agents.safety import SafetyGovernanceAgent
-            from agents.coordinator import Coordinator
-            from django.conf import settings
-
-            phenotyper = PhenotypingAgentV2()
-            notes_agent = NotesImagingAgent()
-            safety_agent = SafetyGovernanceAgent()
-            coordinator = Coordinator(settings.MS_RISK_POLICY)
-
-            patient_data = {
-                'patient_id': patient.patient_id,
-                'age': patient.age,
-                'sex': patient.sex,
-                'note': patient.note,
-                'has_mri': patient.has_mri,
-                'mri_lesions': patient.mri_lesions,
-                'note_has_ms_terms': patient.note_has_ms_terms,
-                'optic_neuritis': patient.optic_neuritis,
-                'paresthesia': patient.paresthesia,
-                'weakness': patient.weakness,
-                'gait_instability': patient.gait_instability,
-                'vertigo': patient.vertigo,
-                'fatigue': patient.fatigue,
-                'bladder_issues': patient.bladder_issues,
-                'cognitive_fog': patient.cognitive_fog,
-                'lookalike_dx': patient.lookalike_dx,
-                'vitamin_d_deficient': patient.vitamin_d_deficient or False,
-                'infectious_mono_history': patient.infectious_mono_history or False,
-                'smartform_neuro_symptom_score': patient.smartform_neuro_symptom_score or 0,
-                'paths_like_function_score': patient.paths_like_function_score or 100,
-                'visits_last_year': patient.visits_last_year,
-            }
-
-            import pandas as pd
-            row = pd.Series(patient_data)
-            risk, contrib = phenotyper.score(row)
-            notes_out = notes_agent.execute(patient_data)
-            safety_out = safety_agent.execute(patient_data, risk)
-            decision = coordinator.execute(risk, safety_out.payload)
-
-            return {
-                'patient_id': patient.patient_id,
-                'risk_score': risk,
-                'feature_contributions': contrib,
-                'notes_analysis': notes_out.payload,
-                'safety': safety_out.payload,
-                'decision': decision.payload,
-            }
-
-        elif tool_name == "run_screening_workflow":
-            from agents.tasks import run_screening_workflow_task
-            task = run_screening_workflow_task.delay(
-                arguments.get('policy_id'),
-                arguments.get('patient_limit')
-            )
-            return {"task_id": task.id, "status": "queued"}
-
-        elif tool_name == "get_patient_risk_card":
-            patient_id = arguments['patient_id']
-            run_id = arguments.get('run_id')
-            qs = RiskAssessment.objects.filter(patient__patient_id=patient_id)
-            if run_id:
-                qs = qs.filter(run_id=run_id)
-            assessment = qs.order_by('-created_at').first()
-            if not assessment:
-                return {"error": "No assessment found"}
-            return {
-                'patient_id': patient_id,
-                'risk_score': assessment.risk_score,
-                'action': assessment.action,
-                'autonomy_level': assessment.autonomy_level,
-                'feature_contributions': assessment.feature_contributions,
-                'flags': assessment.flags,
-                'rationale': assessment.rationale,
-                'patient_card': assessment.patient_card,
-            }
-
-        elif tool_name == "analyze_fairness":
-            return subgroup_analysis(arguments['run_id'], arguments['group_by'])
-
-        elif tool_name == "what_if_policy":
-            run_id = arguments.pop('run_id')
-            return what_if_analysis(run_id, arguments)
-
-        elif tool_name == "get_workflow_metrics":
-            return compute_workflow_metrics(arguments['run_id'])
+        patient_data['vitamin_d_deficient'] = patient_data['vitamin_d_deficient'] or False
+        patient_data['infectious_mono_history'] = patient_data['infectious_mono_history'] or False
+        patient_data['smartform_neuro_symptom_score'] = patient_data['smartform_neuro_symptom_score'] or 0
+        patient_data['paths_like_function_score'] = patient_data['paths_like_function_score'] or 100
+
+        phenotyper = PhenotypingAgentV2()
+        notes_agent = NotesImagingAgent()
+        safety_agent = SafetyGovernanceAgent()
+        coordinator = Coordinator(settings.MS_RISK_POLICY)
+
+        risk, contrib = phenotyper.score(patient_data)
+        notes_out = notes_agent.execute(patient_data)
+        safety_out = safety_agent.execute(patient_data, risk)
+        decision = coordinator.execute(risk, safety_out.payload)
+
+        return {
+            'patient_id': patient_data['patient_id'],
+            'risk_score': risk,
+            'feature_contributions': contrib,
+            'notes_analysis': notes_out.payload,
+            'safety': safety_out.payload,
+            'decision': decision.payload,
+        }
 
-        elif tool_name == "summarize_note":
-            patient = Patient.objects.get(patient_id=arguments['patient_id'])
-            summary = llm_summarize_note(patient.note)
-            return {"patient_id": patient.patient_id, "note_summary": summary}
+    def _tool_run_screening_workflow(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        task = run_screening_workflow_task.delay(
+            arguments.get('policy_id'),
+            arguments.get('patient_limit')
+        )
+        return {"task_id": task.id, "status": "queued"}
+
+    def _tool_get_patient_risk_card(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        patient_id = arguments['patient_id']
+        run_id = arguments.get('run_id')
+        qs = RiskAssessment.raw_objects.filter(patient__patient_id=patient_id)
+        if run_id:
+            qs = qs.filter(run_id=run_id)
+        assessment = qs.select_related('patient_card', 'detail').only(
+            'risk_score', 'action', 'autonomy_level', 'flags', 'patient_card__payload',
+            'detail__feature_contributions', 'detail__rationale',
+        ).order_by('-created_at').first()
+        if not assessment:
+            return {"error": "No assessment found"}
+        return {
+            'patient_id': patient_id,
+            'risk_score': assessment.risk_score,
+            'action': assessment.action,
+            'autonomy_level': assessment.autonomy_level,
+            'feature_contributions': assessment.detail.feature_contributions,
+            'flags': assessment.flags,
+            'rationale': assessment.detail.rationale,
+            'patient_card': assessment.patient_card.payload,
+        }
 
-        elif tool_name == "review_assessment":
-            assessment = RiskAssessment.objects.get(id=arguments['assessment_id'])
-            assessment.reviewed_by = arguments['reviewed_by']
-            assessment.review_notes = arguments.get('review_notes', '')
-            from django.utils import timezone
-            assessment.reviewed_at = timezone.now()
-            if 'override_action' in arguments:
-                assessment.action = arguments['override_action']
-            assessment.save()
-            return {"status": "reviewed", "assessment_id": str(assessment.id)}
+    def _tool_analyze_fairness(self, arguments: Dict[str, Any]) -> Any:
+        return subgroup_analysis(arguments['run_id'], arguments['group_by'])
 
-        return {"error": f"Unknown tool: {tool_name}"}
+    def _tool_what_if_policy(self, arguments: Dict[str, Any]) -> Any:
+        run_id = arguments.pop('run_id')
+        return what_if_analysis(run_id, arguments)
 
-    def read_resource(self, uri: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Read a registered resource."""
-        from patients.models import Patient, RiskAssessment, WorkflowRun, PolicyConfiguration
+    def _tool_get_workflow_metrics(self, arguments: Dict[str, Any]) -> Any:
+        return compute_workflow_metrics(arguments['run_id'])
 
+    def _tool_summarize_note(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        patient = Patient.objects.only('patient_id', 'note').get(
+            patient_id=arguments['patient_id']
+        )
+        summary = llm_summarize_note(patient.note)
+        return {"patient_id": patient.patient_id, "note_summary": summary}
+
+    def _tool_get_tool_result(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        task = AsyncResult(arguments['task_id'])
+        out = {"task_id": task.id, "status": task.status}
+        if task.successful():
+            out["result"] = task.result
+        elif task.failed():
+            out["error"] = str(task.result)
+        return out
+
+    def _tool_review_assessment(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        assessment = RiskAssessment.objects.get(id=arguments['assessment_id'])
+        assessment.reviewed_by = arguments['reviewed_by']
+        assessment.review_notes = arguments.get('review_notes', '')
+        assessment.reviewed_at = timezone.now()
+        if 'override_action' in arguments:
+            assessment.action = arguments['override_action']
+        assessment.save()
+        return {"status": "reviewed", "assessment_id": str(assessment.id)}
+
+    @staticmethod
+    def _resource_rows(uri: str, params: Dict[str, Any]):
+        """
+        ``(values queryset, default page size)`` for the row-bearing resources,
+        or ``None`` for any other URI.
+        """
         if uri == "msrisk://patients":
-            limit = (params or {}).get('limit', 50)
-            patients = Patient.objects.all()[:limit]
-            return {
-                "total": Patient.objects.count(),
-                "data": list(patients.values('patient_id', 'age', 'sex', 'true_at_risk'))
-            }
-        elif uri == "msrisk://assessments":
-            run_id = (params or {}).get('run_id')
+            return Patient.objects.values('patient_id', 'age', 'sex', 'true_at_risk'), 50
+        if uri == "msrisk://assessments":
             qs = RiskAssessment.objects.all()
+            run_id = params.get('run_id')
             if run_id:
                 qs = qs.filter(run_id=run_id)
-            return {
-                "total": qs.count(),
-                "data": list(qs.values(
-                    'patient__patient_id', 'risk_score', 'action', 'autonomy_level'
-                )[:100])
-            }
-        elif uri == "msrisk://policies":
+            return qs.values(
+                'patient__patient_id', 'risk_score', 'action', 'autonomy_level'
+            ), 100
+        return None
+
+    @staticmethod
+    def _int_param(params: Dict[str, Any], name: str, default: Optional[int]) -> Optional[int]:
+        """Non-negative integer ``params[name]``; raises InvalidParams otherwise."""
+        value = params.get(name, default)
+        if value is None:
+            return None
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise InvalidParams(f"{name} must be an integer") from None
+        if value < 0:
+            raise InvalidParams(f"{name} must not be negative")
+        return value
+
+    def _page(self, rows, params: Dict[str, Any], default_limit: int) -> Dict[str, Any]:
+        """
+        One offset/limit page of the ``rows`` values queryset, at most
+        MAX_RESOURCE_LIMIT rows long.
+
+        One extra row is fetched to report ``has_more``; the COUNT(*) over the
+        whole queryset only runs when the caller sets ``include_count``.
+        """
+        offset = self._int_param(params, 'offset', 0)
+        limit = min(self._int_param(params, 'limit', default_limit), MAX_RESOURCE_LIMIT)
+        data = list(rows[offset:offset + limit + 1])
+        page = {"data": data[:limit], "has_more": len(data) > limit}
+        if params.get('include_count'):
+            page["total"] = rows.count()
+        return page
+
+    def stream_resource(self, uri: str, params: Optional[Dict] = None) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Iterate a row-bearing resource without materialising it, for NDJSON
+        streaming. Honours ``offset`` and an optional ``limit``; returns
+        ``None`` for resources that are not row-bearing.
+        """
+        params = params or {}
+        resource = self._resource_rows(uri, params)
+        if resource is None:
+            return None
+        rows, _ = resource
+        offset = self._int_param(params, 'offset', 0)
+        limit = self._int_param(params, 'limit', None)
+        rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+        return rows.iterator(chunk_size=1000)
+
+    def read_resource(self, uri: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Read a registered resource."""
+        params = params or {}
+
+        resource = self._resource_rows(uri, params)
+        if resource is not None:
+            rows, default_limit = resource
+            return self._page(rows, params, default_limit)
+        if uri == "msrisk://policies":
             return {
                 "data": list(PolicyConfiguration.objects.values())
             }
         elif uri == "msrisk://governance":
-            from governance.models import GovernanceRule
             return {
                 "data": list(GovernanceRule.objects.values())
             }
@@ -0,0 +1,22 @@
+"""
+JSON responses for MCP payloads.
+
+Every server that returns MCP tool results -- the Django views, the aiohttp
+MCP server and the A2A gateway that relays tool calls -- encodes them with
+``json_dumps``, so numpy scalars, non-string keys and Decimals are handled
+the same way everywhere.
+"""
+from aiohttp import web
+from django.http import HttpResponse
+
+from .protocol import json_dumps
+
+
+def orjson_response(data, status=200):
+    """Django JSON response encoded with ``json_dumps``."""
+    return HttpResponse(json_dumps(data), status=status, content_type="application/json")
+
+
+def aiohttp_orjson_response(data, status=200):
+    """aiohttp JSON response encoded with ``json_dumps``."""
+    return web.Response(body=json_dumps(data), status=status, content_type="application/json")
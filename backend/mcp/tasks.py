@@ -0,0 +1,13 @@
+"""Celery tasks for long-running MCP tool invocations."""
+from celery import shared_task
+
+
+@shared_task(queue='agents')
+def execute_mcp_tool_task(tool_name, arguments):
+    """
+    Run a slow MCP tool (agent pipeline, LLM call) off the HTTP worker.
+
+    The result is fetched later through the ``get_tool_result`` tool.
+    """
+    from .protocol import mcp_server
+    return mcp_server._execute_tool(tool_name, arguments)
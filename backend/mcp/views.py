@@ -1,10 +1,12 @@
 """MCP HTTP endpoint views."""
-import json
 import logging
-from django.http import JsonResponse
+
+import orjson
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from .protocol import mcp_server
+from .protocol import InvalidParams, json_dumps, mcp_server
+from .responses import orjson_response
 
 logger = logging.getLogger('mcp')
 
@@ -12,54 +14,68 @@ logger = logging.getLogger('mcp')
 @csrf_exempt
 @require_http_methods(["GET"])
 def list_tools(request):
-    return JsonResponse({"tools": mcp_server.list_tools()})
+    return HttpResponse(mcp_server.tools_json(), content_type="application/json")
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def list_resources(request):
-    return JsonResponse({"resources": mcp_server.list_resources()})
+    return HttpResponse(mcp_server.resources_json(), content_type="application/json")
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def create_session(request):
     session_id = mcp_server.create_session()
-    return JsonResponse({"session_id": session_id})
+    return orjson_response({"session_id": session_id})
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def invoke_tool(request):
     try:
-        body = json.loads(request.body)
+        body = orjson.loads(request.body)
         session_id = body.get("session_id", "")
         tool_name = body.get("tool_name")
         arguments = body.get("arguments", {})
         
         if not tool_name:
-            return JsonResponse({"error": "tool_name required"}, status=400)
+            return orjson_response({"error": "tool_name required"}, status=400)
         
-        result = mcp_server.invoke_tool(session_id, tool_name, arguments)
-        return JsonResponse(result)
+        result = mcp_server.invoke_tool(
+            session_id, tool_name, arguments, sync=bool(body.get("sync", False))
+        )
+        return orjson_response(result)
     except Exception as e:
         logger.error(f"MCP invoke error: {e}")
-        return JsonResponse({"error": str(e)}, status=500)
+        return orjson_response({"error": str(e)}, status=500)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def read_resource(request):
     try:
-        body = json.loads(request.body)
+        body = orjson.loads(request.body)
         uri = body.get("uri")
         params = body.get("params", {})
         
         if not uri:
-            return JsonResponse({"error": "uri required"}, status=400)
-        
+            return orjson_response({"error": "uri required"}, status=400)
+
+        if params.get("stream"):
+            # NDJSON, one row per line, encoded as the server-side cursor yields
+            rows = mcp_server.stream_resource(uri, params)
+            if rows is None:
+                return orjson_response({"error": f"Resource cannot be streamed: {uri}"}, status=400)
+            return StreamingHttpResponse(
+                (json_dumps(row) + b"\n" for row in rows),
+                content_type="application/x-ndjson",
+            )
+
         result = mcp_server.read_resource(uri, params)
-        return JsonResponse(result)
+        return orjson_response(result)
+    except InvalidParams as e:
+        return orjson_response(e.to_dict(), status=400)
     except Exception as e:
         logger.error(f"MCP read error: {e}")
-        return JsonResponse({"error": str(e)}, status=500)
+        return orjson_response({"error": str(e)}, status=500)
@@ -1,6 +1,12 @@
 from django.contrib import admin
 
-from .models import Patient, PolicyConfiguration, RiskAssessment, WorkflowRun
+from .models import (
+    Patient,
+    PolicyConfiguration,
+    RiskAssessment,
+    RiskAssessmentDetail,
+    WorkflowRun,
+)
 
 
 @admin.register(Patient)
@@ -81,10 +87,10 @@ class PatientAdmin(admin.ModelAdmin):
         ),
     )
 
-    def symptom_count(self, obj):
-        return obj.symptom_count
 
-    symptom_count.short_description = "Symptoms"
+class RiskAssessmentDetailInline(admin.StackedInline):
+    model = RiskAssessmentDetail
+    can_delete = False
 
 
 @admin.register(RiskAssessment)
@@ -107,8 +113,14 @@ class RiskAssessmentAdmin(admin.ModelAdmin):
         "flag_count",
     )
     search_fields = ("patient__patient_id", "reviewed_by", "review_notes")
-    readonly_fields = ("id", "created_at", "updated_at")
-    raw_id_fields = ("patient",)
+    readonly_fields = ("id", "patient_card", "created_at", "updated_at")
+    autocomplete_fields = ("patient",)
+    inlines = (RiskAssessmentDetailInline,)
+
+    def has_add_permission(self, request):
+        # Assessments are written only by the screening workflow, which also
+        # stores the card snapshot they point at.
+        return False
 
 
 @admin.register(PolicyConfiguration)
@@ -148,4 +160,4 @@ class WorkflowRunAdmin(admin.ModelAdmin):
     list_filter = ("status",)
     search_fields = ("error_message",)
     readonly_fields = ("id", "created_at", "updated_at")
-    raw_id_fields = ("policy",)
+    autocomplete_fields = ("policy",)
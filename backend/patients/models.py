@@ -1,9 +1,19 @@
-import uuid
+import hashlib
 
-from django.db import models
+import orjson
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F, Prefetch, Q
+from django.db.models.functions import Cast, Now, Upper
+from django.db.models.lookups import Exact
+from django.utils import timezone
 
+from core.models import TimeStampedModel
+from core.serialization import OrjsonDecoder, OrjsonEncoder
 
-class Patient(models.Model):
+
+class Patient(TimeStampedModel):
     """
     Synthetic patient record for MS risk screening.
     Fields mirror the notebook's make_patients() output plus augmented marker columns.
@@ -14,8 +24,7 @@ class Patient(models.Model):
         ("M", "Male"),
     ]
 
-    # Primary key & identifiers
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Identifiers
     patient_id = models.CharField(max_length=10, unique=True, help_text="Format P00000")
 
     # Demographics & utilisation
@@ -70,10 +79,6 @@ class Patient(models.Model):
         help_text="PATHS-like neuroperformance function score (0-100, lower is worse)",
     )
 
-    # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-
     # --- Computed helpers ---
     SYMPTOM_FIELDS = [
         "optic_neuritis",
@@ -86,21 +91,104 @@ class Patient(models.Model):
         "cognitive_fog",
     ]
 
-    @property
-    def symptom_count(self) -> int:
-        """Return the number of active symptom flags for this patient."""
-        return sum(
-            1 for field in self.SYMPTOM_FIELDS if getattr(self, field)
-        )
+    # Number of active symptom flags, computed by the database on write so
+    # list views and aggregates read a plain column instead of summing the
+    # booleans per instance. Like any generated field, it is only populated
+    # once the row has been saved.
+    symptom_count = models.GeneratedField(
+        expression=sum(
+            (Cast(F(field), models.IntegerField()) for field in SYMPTOM_FIELDS[1:]),
+            Cast(F(SYMPTOM_FIELDS[0]), models.IntegerField()),
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        verbose_name="symptoms",
+    )
+    # The same flags packed into one integer, bit i = SYMPTOM_FIELDS[i], so
+    # symptom combinations can be matched or grouped on a single column.
+    symptom_bits = models.GeneratedField(
+        expression=sum(
+            (
+                Cast(F(field), models.IntegerField()) * (1 << i)
+                for i, field in enumerate(SYMPTOM_FIELDS) if i
+            ),
+            Cast(F(SYMPTOM_FIELDS[0]), models.IntegerField()),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ["patient_id"]
+        indexes = [
+            # Trigram index for admin search/autocomplete, which filters with
+            # UPPER(patient_id) LIKE UPPER('%term%') (needs pg_trgm)
+            GinIndex(
+                OpClass(Upper("patient_id"), name="gin_trgm_ops"),
+                name="patient_id_trgm",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.patient_id} (age={self.age}, sex={self.sex})"
 
+    @classmethod
+    def list_qs(cls):
+        """Patients without the free-text note, for listings that never show it."""
+        return cls.objects.defer("note")
+
+    @classmethod
+    def with_recent_assessments(cls, limit: int = 20):
+        """
+        Patients with their ``limit`` newest assessments prefetched into
+        ``recent_assessments`` (one extra query for the whole queryset).
+        """
+        recent = (
+            RiskAssessment.raw_objects.select_related("patient_card", "detail")
+            .order_by("-created_at")[:limit]
+        )
+        return cls.objects.prefetch_related(
+            Prefetch("risk_assessments", queryset=recent, to_attr="recent_assessments")
+        )
+
 
-class RiskAssessment(models.Model):
+class PatientCardSnapshot(models.Model):
+    """
+    Content-addressed patient-card payload shared by every RiskAssessment
+    whose card is identical (e.g. the same patient re-screened under the same
+    policy), so each distinct card is stored once.
+    """
+
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    payload = models.JSONField(
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
+        help_text="Snapshot of patient data at assessment time",
+    )
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    @staticmethod
+    def digest(card: dict) -> str:
+        """SHA-256 of the card's canonical (key-sorted) JSON encoding."""
+        encoded = orjson.dumps(card, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return hashlib.sha256(encoded).hexdigest()
+
+    def __str__(self) -> str:
+        return f"Card {self.sha256[:12]}"
+
+
+class RiskAssessmentManager(models.Manager):
+    """
+    Joins the patient, which __str__ and most readers dereference. The card
+    snapshot and detail row are joined only by the readers that serialize
+    them.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("patient")
+
+
+class RiskAssessment(TimeStampedModel):
     """
     One risk-assessment record per workflow run per patient.
     Stores the phenotyping score, action decision, safety flags, and review state.
@@ -119,7 +207,6 @@ class RiskAssessment(models.Model):
         ("AUTO_ORDER_WITH_GUARDRAILS", "Auto-Order with Guardrails"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     patient = models.ForeignKey(
         Patient,
         on_delete=models.CASCADE,
@@ -132,21 +219,129 @@ class RiskAssessment(models.Model):
     action = models.CharField(max_length=50, choices=ACTION_CHOICES)
     autonomy_level = models.CharField(max_length=40, choices=AUTONOMY_CHOICES)
 
-    # Interpretability
-    feature_contributions = models.JSONField(
-        default=dict,
-        help_text="Per-feature contribution dict from phenotyping agent",
-    )
+    # Safety flags (the bulky interpretability payloads live on RiskAssessmentDetail)
     flags = models.JSONField(
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
         default=list,
         help_text="List of safety / governance flags",
     )
-    flag_count = models.IntegerField(default=0)
+    # Maintained by the database from ``flags`` so the two cannot drift.
+    # jsonb_array_length() raises on scalars/objects, so non-array flags count 0.
+    flag_count = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                Exact(
+                    models.Func(
+                        F("flags"), function="jsonb_typeof", output_field=models.CharField()
+                    ),
+                    "array",
+                ),
+                then=models.Func(
+                    F("flags"), function="jsonb_array_length", output_field=models.IntegerField()
+                ),
+            ),
+            default=0,
+            output_field=models.IntegerField(),
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+    # Patient card snapshot (deduplicated by content hash)
+    patient_card = models.ForeignKey(
+        PatientCardSnapshot,
+        on_delete=models.PROTECT,
+        related_name="assessments",
+    )
+
+    # Clinician review
+    reviewed_by = models.CharField(max_length=150, blank=True, default="")
+    review_notes = models.TextField(blank=True, default="")
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+
+    objects = RiskAssessmentManager()
+    # Plain manager for queries that never touch the patient row
+    raw_objects = models.Manager()
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # high_risk: risk_score >= threshold ORDER BY -risk_score LIMIT 100
+            models.Index(fields=["-risk_score"], name="ra_riskscore_desc"),
+            # pending_review: unreviewed rows filtered by action, ordered by score
+            models.Index(
+                fields=["action", "-risk_score"],
+                condition=Q(reviewed_at__isnull=True),
+                name="ra_pending_partial",
+            ),
+            # admin list_filter sidebar / combined action + autonomy filters
+            models.Index(
+                fields=["action", "autonomy_level", "flag_count"],
+                name="ra_filter_idx",
+            ),
+            # unfiltered list, newest first (default ordering)
+            models.Index(fields=["-created_at"], name="ra_created"),
+            # per-run analytics and latest-assessment lookups
+            models.Index(fields=["run_id", "-created_at"], name="ra_run_created"),
+            # a patient's assessment history, newest first
+            models.Index(fields=["patient", "-created_at"], name="ra_patient_created"),
+            # safety-flag containment: flags__contains=["LOW_EVIDENCE_CASE"]
+            GinIndex(fields=["flags"], opclasses=["jsonb_path_ops"], name="ra_flags_gin"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Assessment {str(self.id)[:8]} – {self.patient.patient_id} risk={self.risk_score:.2f}"
+
+    @classmethod
+    def list_qs(cls):
+        """
+        Assessments with their patient but without the card or the detail
+        payloads, for scans that only read scores, actions and flags.
+        """
+        return cls.raw_objects.select_related("patient").defer("patient_card", "patient__note")
+
+    @classmethod
+    def bulk_mark_reviewed(cls, ids, reviewer: str, notes: str = "", reviewed_at=None) -> int:
+        """Mark the given assessments reviewed in a single UPDATE; returns the row count."""
+        reviewed_at = reviewed_at or timezone.now()
+        return cls.raw_objects.filter(id__in=ids).update(
+            reviewed_by=reviewer,
+            review_notes=notes,
+            reviewed_at=reviewed_at,
+            # update() bypasses auto_now
+            updated_at=reviewed_at,
+        )
+
+
+class RiskAssessmentDetail(models.Model):
+    """
+    Interpretability payloads for one RiskAssessment, kept in their own table
+    so scans and aggregates over the assessment rows don't read them. Loaded
+    only when an assessment is shown in full.
+    """
+
+    assessment = models.OneToOneField(
+        RiskAssessment,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="detail",
+    )
+    feature_contributions = models.JSONField(
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
+        default=dict,
+        help_text="Per-feature contribution dict from phenotyping agent",
+    )
     rationale = models.JSONField(
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
         default=dict,
         help_text="Coordinator rationale payload",
     )
     notes_analysis = models.JSONField(
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
         default=dict,
         help_text="Notes/Imaging agent output",
     )
@@ -154,35 +349,24 @@ class RiskAssessment(models.Model):
     # LLM summary (optional)
     llm_summary = models.TextField(blank=True, default="")
 
-    # Patient card snapshot
-    patient_card = models.JSONField(
-        default=dict,
-        help_text="Snapshot of patient data at assessment time",
-    )
+    def __str__(self) -> str:
+        return f"Detail for assessment {str(self.assessment_id)[:8]}"
 
-    # Clinician review
-    reviewed_by = models.CharField(max_length=150, blank=True, default="")
-    review_notes = models.TextField(blank=True, default="")
-    reviewed_at = models.DateTimeField(null=True, blank=True)
 
-    # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+# Cached {"id", "name"} of the active policy (see api.views._get_active_policy_ref)
+ACTIVE_POLICY_CACHE_KEY = "policy:active"
 
-    class Meta:
-        ordering = ["-created_at"]
 
-    def __str__(self) -> str:
-        return f"Assessment {str(self.id)[:8]} – {self.patient.patient_id} risk={self.risk_score:.2f}"
+def _clear_active_policy_cache():
+    cache.delete(ACTIVE_POLICY_CACHE_KEY)
 
 
-class PolicyConfiguration(models.Model):
+class PolicyConfiguration(TimeStampedModel):
     """
     Stores threshold and autonomy-limit settings for a workflow policy.
-    Only one configuration should be active at a time.
+    Only one configuration can be active at a time (enforced in the database).
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=120)
 
     # Risk-score thresholds
@@ -205,18 +389,55 @@ class PolicyConfiguration(models.Model):
 
     # Audit
     created_by = models.CharField(max_length=150)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        constraints = [
+            # At most one active policy; the partial unique index also serves
+            # the filter(is_active=True) lookup.
+            models.UniqueConstraint(
+                fields=["is_active"],
+                condition=Q(is_active=True),
+                name="one_active_policy_cfg",
+            ),
+        ]
 
     def __str__(self) -> str:
         active_label = " [ACTIVE]" if self.is_active else ""
         return f"{self.name}{active_label}"
 
+    def validate_constraints(self, exclude=None):
+        # An active-policy conflict is resolved by save(), not a form error
+        exclude = set(exclude or ()) | {"is_active"}
+        super().validate_constraints(exclude=exclude)
+
+    def save(self, *args, **kwargs):
+        if self.is_active:
+            # Saving a policy as active deactivates the current one first, so
+            # the one_active_policy_cfg constraint holds.
+            with transaction.atomic():
+                PolicyConfiguration.objects.filter(is_active=True).exclude(pk=self.pk).update(
+                    is_active=False
+                )
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+        transaction.on_commit(_clear_active_policy_cache)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(_clear_active_policy_cache)
+        return result
+
+
+class WorkflowRunManager(models.Manager):
+    """Joins the policy, which run listings display by name."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("policy")
+
 
-class WorkflowRun(models.Model):
+class WorkflowRun(TimeStampedModel):
     """
     Tracks a single execution of the multi-agent screening pipeline.
     """
@@ -228,7 +449,6 @@ class WorkflowRun(models.Model):
         ("FAILED", "Failed"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     policy = models.ForeignKey(
         PolicyConfiguration,
         on_delete=models.PROTECT,
@@ -257,12 +477,19 @@ class WorkflowRun(models.Model):
     duration_seconds = models.FloatField(null=True, blank=True)
     error_message = models.TextField(blank=True, default="")
 
-    # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    objects = WorkflowRunManager()
+    raw_objects = models.Manager()
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # unfiltered run list and dashboard recent runs, newest first
+            models.Index(fields=["-created_at"], name="run_created"),
+            # latest run by status, e.g. the most recent COMPLETED run
+            models.Index(fields=["status", "-created_at"], name="run_status_created"),
+            # runs per policy, newest first
+            models.Index(fields=["policy", "-created_at"], name="run_policy_created"),
+        ]
 
     def __str__(self) -> str:
         return f"Run {str(self.id)[:8]} [{self.status}] – {self.candidates_found} candidates"